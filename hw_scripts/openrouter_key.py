@@ -1,23 +1,60 @@
 #!/usr/bin/env python3
+from __future__ import annotations
+
+import asyncio
 import os
+import random
 import sys
 import time
 import csv
-
-# Check for required dependencies
-try:
-    import requests
-except ImportError:
-    print("Error: Missing required dependency 'requests'", file=sys.stderr)
-    print("\nPlease install dependencies by running:", file=sys.stderr)
-    print("  pip install -r requirements.txt", file=sys.stderr)
-    print("\nOr install requests directly:", file=sys.stderr)
-    print("  pip install requests", file=sys.stderr)
-    sys.exit(1)
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 BASE_URL = "https://openrouter.ai/api/v1/keys"
 MAX_RETRIES = 5
 INITIAL_BACKOFF = 1.0  # seconds
+CREATE_CONCURRENCY = 20  # max in-flight key-creation requests
+DELETE_CONCURRENCY = 8  # max in-flight key-deletion requests (kept low to avoid self-inflicted 429s)
+PAGE_SIZE = 100  # keys per page returned by the list endpoint
+LIST_PREFETCH_WINDOW = 8  # pages fetched concurrently per window
+
+_METHODS: dict | None = None
+
+
+def _load_deps() -> None:
+    """
+    Import requests/aiohttp and set up the shared session on first use.
+
+    Deferring the imports keeps `--help` (and argparse errors) instant; a
+    missing dependency still exits with install instructions. The shared
+    session reuses one TCP+TLS connection pool instead of paying the
+    handshake cost per request; retries stay in request_with_retry, not the
+    adapter. The bound session methods are resolved once so the retry loop
+    does a single dict probe per call instead of a getattr per attempt.
+    """
+    global requests, aiohttp, _METHODS
+
+    if _METHODS is not None:
+        return
+
+    for package in ("requests", "aiohttp"):
+        try:
+            globals()[package] = __import__(package)
+        except ImportError:
+            print(f"Error: Missing required dependency '{package}'", file=sys.stderr)
+            print("\nPlease install dependencies by running:", file=sys.stderr)
+            print("  pip install -r requirements.txt", file=sys.stderr)
+            print(f"\nOr install {package} directly:", file=sys.stderr)
+            print(f"  pip install {package}", file=sys.stderr)
+            sys.exit(1)
+
+    session = requests.Session()
+    session.mount("https://", requests.adapters.HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=0))
+    _METHODS = {
+        "get": session.get,
+        "post": session.post,
+        "delete": session.delete,
+    }
 
 
 class RateLimitExhausted(Exception):
@@ -25,6 +62,34 @@ class RateLimitExhausted(Exception):
     pass
 
 
+def _rate_limit_delay(headers) -> float | None:
+    """
+    Extract the server-advised retry delay (seconds) from a 429 response.
+
+    Honors Retry-After (delta-seconds form) and X-RateLimit-Reset (epoch
+    seconds or milliseconds). Returns None when the response carries no
+    usable hint, in which case the caller falls back to exponential backoff.
+    """
+    retry_after = headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            pass  # HTTP-date form; fall through to other hints
+
+    reset = headers.get("X-RateLimit-Reset")
+    if reset is not None:
+        try:
+            reset_s = float(reset)
+        except ValueError:
+            return None
+        if reset_s > 1e12:  # epoch milliseconds
+            reset_s /= 1000.0
+        return max(reset_s - time.time(), 0.0)
+
+    return None
+
+
 def request_with_retry(method: str, url: str, **kwargs) -> requests.Response:
     """
     Make an HTTP request with exponential backoff retry on rate limit (429) errors.
@@ -41,16 +106,24 @@ def request_with_retry(method: str, url: str, **kwargs) -> requests.Response:
         RateLimitExhausted: If max retries exceeded due to rate limiting
         requests.exceptions.RequestException: For other request errors
     """
+    _load_deps()
     backoff = INITIAL_BACKOFF
+    fn = _METHODS[method]
 
     for attempt in range(MAX_RETRIES):
-        response = getattr(requests, method)(url, **kwargs)
+        response = fn(url, **kwargs)
 
         if response.status_code == 429:
             if attempt < MAX_RETRIES - 1:
-                print(f"  ⏳ Rate limited, waiting {backoff:.1f}s before retry ({attempt + 1}/{MAX_RETRIES})...")
-                time.sleep(backoff)
-                backoff *= 2  # exponential backoff
+                # Prefer the server-advised delay; fall back to (and grow)
+                # exponential backoff only when the response gives no hint
+                delay = _rate_limit_delay(response.headers)
+                if delay is None:
+                    delay = backoff
+                    backoff *= 2
+                delay += random.uniform(0, 0.25)  # jitter to avoid thundering herd
+                print(f"  ⏳ Rate limited, waiting {delay:.1f}s before retry ({attempt + 1}/{MAX_RETRIES})...")
+                time.sleep(delay)
                 continue
             else:
                 raise RateLimitExhausted(f"Rate limit exceeded after {MAX_RETRIES} retries")
@@ -61,6 +134,48 @@ def request_with_retry(method: str, url: str, **kwargs) -> requests.Response:
     raise RateLimitExhausted(f"Rate limit exceeded after {MAX_RETRIES} retries")
 
 
+async def request_with_retry_async(session: "aiohttp.ClientSession", method: str, url: str, **kwargs) -> dict:
+    """
+    Async variant of request_with_retry: make a request with exponential backoff
+    retry on rate limit (429) errors and return the parsed JSON body.
+
+    Args:
+        session: aiohttp client session to issue the request on
+        method: HTTP method (get, post, delete)
+        url: Request URL
+        **kwargs: Arguments passed to aiohttp
+
+    Returns:
+        Parsed JSON response body
+
+    Raises:
+        RateLimitExhausted: If max retries exceeded due to rate limiting
+        aiohttp.ClientResponseError: For other HTTP errors
+    """
+    backoff = INITIAL_BACKOFF
+
+    for attempt in range(MAX_RETRIES):
+        async with session.request(method, url, **kwargs) as response:
+            if response.status == 429:
+                if attempt < MAX_RETRIES - 1:
+                    delay = _rate_limit_delay(response.headers)
+                    if delay is None:
+                        delay = backoff
+                        backoff *= 2
+                    delay += random.uniform(0, 0.25)  # jitter to avoid thundering herd
+                    print(f"  ⏳ Rate limited, waiting {delay:.1f}s before retry ({attempt + 1}/{MAX_RETRIES})...")
+                    await asyncio.sleep(delay)
+                    continue
+                else:
+                    raise RateLimitExhausted(f"Rate limit exceeded after {MAX_RETRIES} retries")
+
+            response.raise_for_status()
+            return await response.json()
+
+    # Should not reach here, but just in case
+    raise RateLimitExhausted(f"Rate limit exceeded after {MAX_RETRIES} retries")
+
+
 def get_headers():
     provisioning_key = os.environ.get("OPENROUTER_PROVISIONING_KEY")
     if not provisioning_key:
@@ -74,7 +189,11 @@ def get_headers():
 def list_keys(prefix: str | None = None, include_disabled: bool = False) -> list[dict]:
     """
     List all API keys, optionally filtered by name prefix.
-    
+
+    The prefix is also sent as a server-side search filter so matching keys
+    arrive in as few pages as possible; results are still filtered with
+    startswith locally in case the server matches more loosely.
+
     Args:
         prefix: Only return keys whose names start with this prefix
         include_disabled: Whether to include disabled keys
@@ -83,31 +202,43 @@ def list_keys(prefix: str | None = None, include_disabled: bool = False) -> list
         List of key objects
     """
     headers = get_headers()
-    params = {
+    # Base params built once; each page only adds its offset
+    base_params = {
         "include_disabled": "true" if include_disabled else "false"
     }
-    
+    if prefix:
+        # Push the filter to the server to cut pages fetched; the client-side
+        # startswith below stays as a defensive post-filter since search may
+        # match more broadly than a strict name prefix
+        base_params["search"] = prefix
+
+    def fetch_page(off: int) -> requests.Response:
+        return request_with_retry("get", BASE_URL, headers=headers,
+                                  params={**base_params, "offset": str(off)})
+
+    # Fetch pages in concurrent windows instead of walking offsets serially:
+    # the API doesn't report a total count, so probe LIST_PREFETCH_WINDOW
+    # pages at a time and stop at the first short page (discarding the
+    # speculative pages after it)
     all_keys = []
     offset = 0
-    
-    while True:
-        params["offset"] = str(offset)
-        response = request_with_retry("get", BASE_URL, headers=headers, params=params)
-        response.raise_for_status()
-        
-        data = response.json()
-        keys = data.get("data", [])
-        
-        if not keys:
-            break
-            
-        all_keys.extend(keys)
-        offset += len(keys)
-        
-        # If we got fewer than expected, we've reached the end
-        if len(keys) < 100:
-            break
-    
+
+    with ThreadPoolExecutor(max_workers=LIST_PREFETCH_WINDOW) as pool:
+        done = False
+        while not done:
+            offsets = range(offset, offset + LIST_PREFETCH_WINDOW * PAGE_SIZE, PAGE_SIZE)
+            for response in pool.map(fetch_page, offsets):
+                response.raise_for_status()
+                keys = response.json().get("data", [])
+                all_keys.extend(keys)
+
+                # A short page means we've reached the end
+                if len(keys) < PAGE_SIZE:
+                    done = True
+                    break
+            offset += LIST_PREFETCH_WINDOW * PAGE_SIZE
+
+
     # Filter by prefix if specified
     if prefix:
         all_keys = [k for k in all_keys if k.get("name", "").startswith(prefix)]
@@ -115,7 +246,29 @@ def list_keys(prefix: str | None = None, include_disabled: bool = False) -> list
     return all_keys
 
 
-def create_keys(
+async def _create_one(
+    session: "aiohttp.ClientSession",
+    sem: asyncio.Semaphore,
+    name: str,
+    payload: dict
+) -> tuple[str, dict | None, str | None]:
+    """Create a single key under the concurrency semaphore.
+
+    Returns (name, response_data, error_message); exactly one of
+    response_data/error_message is None. RateLimitExhausted propagates so the
+    caller can stop the whole batch.
+    """
+    async with sem:
+        try:
+            data = await request_with_retry_async(session, "post", BASE_URL, json=payload)
+        except aiohttp.ClientResponseError as e:
+            return name, None, f"{e.status} {e.message}"
+        except aiohttp.ClientError as e:
+            return name, None, str(e)
+    return name, data, None
+
+
+async def create_keys_async(
     n: int,
     name_prefix: str = "student",
     limit_usd: float = 5.0,
@@ -124,8 +277,12 @@ def create_keys(
     output_csv: str = "student_keys.csv"
 ) -> tuple[list[dict], list[dict]]:
     """
-    Create n OpenRouter API keys.
-    
+    Create n OpenRouter API keys, issuing requests concurrently.
+
+    Up to CREATE_CONCURRENCY creations are in flight at once, so total wall
+    time is ~n/CREATE_CONCURRENCY round-trips instead of n. Completed keys are
+    appended to the CSV as they arrive, so a crash mid-run loses nothing.
+
     Args:
         n: Number of keys to create
         name_prefix: Prefix for key names (will be "{prefix}_001", "{prefix}_002", etc.)
@@ -133,26 +290,24 @@ def create_keys(
         limit_reset: Reset period - "daily", "weekly", "monthly", or None
         expires_at: Optional expiration date in ISO 8601 format (e.g., "2025-06-01T23:59:59Z")
         output_csv: Path to save the generated keys
-    
+
     Returns:
         Tuple of (created_keys, failed_keys)
     """
+    _load_deps()
     headers = get_headers()
 
-    # Load existing keys from CSV if it exists
-    existing_keys = []
+    # Load existing key names from CSV if it exists; only membership is
+    # checked, so keep the name strings rather than full row dicts
     existing_names = set()
     if os.path.exists(output_csv):
         with open(output_csv, "r") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                existing_keys.append(row)
-                existing_names.add(row.get("name", ""))
+            existing_names = {row.get("name", "") for row in csv.DictReader(f)}
         if existing_names:
             print(f"Found {len(existing_names)} existing keys in {output_csv}")
 
-    created_keys = []
-    failed = []
+    # Build payloads for the keys that don't exist yet
+    pending = []
     skipped = 0
 
     for i in range(1, n + 1):
@@ -161,56 +316,66 @@ def create_keys(
         if name in existing_names:
             skipped += 1
             continue
-        
+
         payload = {
             "name": name,
             "limit": limit_usd,
         }
-        
+
         if limit_reset:
             payload["limit_reset"] = limit_reset
-        
+
         if expires_at:
             payload["expires_at"] = expires_at
-        
-        try:
-            response = request_with_retry("post", BASE_URL, json=payload, headers=headers)
-            response.raise_for_status()
 
-            data = response.json()
-            key_info = {
-                "name": name,
-                "key": data["key"],
-                "hash": data["data"]["hash"],
-                "limit_usd": limit_usd,
-                "limit_reset": limit_reset or "none",
-                "created_at": data["data"]["created_at"]
-            }
-            created_keys.append(key_info)
-            print(f"✓ Created key {i}/{n}: {name}")
-
-        except RateLimitExhausted as e:
-            print(f"\n✗ {e}. Stopping.")
-            failed.append({"name": name, "error": str(e)})
-            break
-
-        except requests.exceptions.RequestException as e:
-            error_msg = str(e)
-            if hasattr(e, 'response') and e.response is not None:
-                try:
-                    error_msg = e.response.json()
-                except:
-                    error_msg = e.response.text
-            failed.append({"name": name, "error": error_msg})
-            print(f"✗ Failed to create key {i}/{n}: {name} - {error_msg}")
-    
-    # Save to CSV (merge existing + new)
-    all_keys = existing_keys + created_keys
-    if all_keys:
-        with open(output_csv, "w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=["name", "key", "hash", "limit_usd", "limit_reset", "created_at"])
+        pending.append((name, payload))
+
+    created_keys = []
+    failed = []
+
+    sem = asyncio.Semaphore(CREATE_CONCURRENCY)
+    connector = aiohttp.TCPConnector(limit=CREATE_CONCURRENCY)
+
+    # Append rows as creations complete (completion order), line-buffered so
+    # every key hits disk as soon as it's created and a crash loses nothing
+    with open(output_csv, "a", newline="", buffering=1) as f:
+        writer = csv.DictWriter(f, fieldnames=["name", "key", "hash", "limit_usd", "limit_reset", "created_at"])
+        if f.tell() == 0:  # new or empty file: emit the header
             writer.writeheader()
-            writer.writerows(all_keys)
+
+        async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
+            tasks = [asyncio.ensure_future(_create_one(session, sem, name, payload))
+                     for name, payload in pending]
+            done = 0
+
+            for future in asyncio.as_completed(tasks):
+                try:
+                    name, data, error = await future
+                except RateLimitExhausted as e:
+                    print(f"\n✗ {e}. Stopping.")
+                    failed.append({"name": "(batch)", "error": str(e)})
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+                    break
+
+                done += 1
+                if error is not None:
+                    failed.append({"name": name, "error": error})
+                    print(f"✗ Failed to create key {done}/{len(pending)}: {name} - {error}")
+                    continue
+
+                key_info = {
+                    "name": name,
+                    "key": data["key"],
+                    "hash": data["data"]["hash"],
+                    "limit_usd": limit_usd,
+                    "limit_reset": limit_reset or "none",
+                    "created_at": data["data"]["created_at"]
+                }
+                created_keys.append(key_info)
+                writer.writerow(key_info)
+                print(f"✓ Created key {done}/{len(pending)}: {name}")
 
     # Summary
     print()
@@ -220,12 +385,31 @@ def create_keys(
         print(f"✓ Created {len(created_keys)} new keys")
     if failed:
         print(f"✗ {len(failed)} keys failed to create")
-    if all_keys:
-        print(f"📄 Saved {len(all_keys)} total keys to {output_csv}")
+    if existing_names or created_keys:
+        print(f"📄 Saved {len(existing_names) + len(created_keys)} total keys to {output_csv}")
 
     return created_keys, failed
 
 
+def create_keys(
+    n: int,
+    name_prefix: str = "student",
+    limit_usd: float = 5.0,
+    limit_reset: str | None = "monthly",
+    expires_at: str | None = None,
+    output_csv: str = "student_keys.csv"
+) -> tuple[list[dict], list[dict]]:
+    """Create n OpenRouter API keys (synchronous wrapper around create_keys_async)."""
+    return asyncio.run(create_keys_async(
+        n=n,
+        name_prefix=name_prefix,
+        limit_usd=limit_usd,
+        limit_reset=limit_reset,
+        expires_at=expires_at,
+        output_csv=output_csv
+    ))
+
+
 def delete_keys(
     prefix: str | None = None,
     from_csv: str | None = None,
@@ -283,29 +467,48 @@ def delete_keys(
     
     deleted = []
     failed = []
-    
-    for i, key in enumerate(keys_to_delete, 1):
-        try:
-            response = request_with_retry("delete", f"{BASE_URL}/{key['hash']}", headers=headers)
-            response.raise_for_status()
-            deleted.append(key["name"])
-            print(f"✓ Deleted {i}/{len(keys_to_delete)}: {key['name']}")
+    total = len(keys_to_delete)
+    print_lock = threading.Lock()  # serialize progress vs. retry messages from workers
+
+    def delete_one(key: dict) -> None:
+        response = request_with_retry("delete", f"{BASE_URL}/{key['hash']}", headers=headers)
+        response.raise_for_status()
+
+    # Delete concurrently: the serial loop paid one round-trip per key,
+    # which dominates end-of-semester cleanup of hundreds of keys
+    with ThreadPoolExecutor(max_workers=DELETE_CONCURRENCY) as pool:
+        futures = {pool.submit(delete_one, key): key for key in keys_to_delete}
+        done = 0
+
+        for future in as_completed(futures):
+            key = futures[future]
+            done += 1
+            try:
+                future.result()
+                deleted.append(key["name"])
+                with print_lock:
+                    print(f"✓ Deleted {done}/{total}: {key['name']}")
+
+            except RateLimitExhausted as e:
+                with print_lock:
+                    print(f"\n✗ {e}. Stopping.")
+                failed.append({"name": key["name"], "error": str(e)})
+                for pending in futures:
+                    pending.cancel()
+                break
+
+            except requests.exceptions.RequestException as e:
+                error_msg = str(e)
+                if hasattr(e, 'response') and e.response is not None:
+                    try:
+                        error_msg = e.response.json()
+                    except:
+                        error_msg = e.response.text
+                failed.append({"name": key["name"], "error": error_msg})
+                with print_lock:
+                    print(f"✗ Failed to delete {done}/{total}: {key['name']} - {error_msg}")
 
-        except RateLimitExhausted as e:
-            print(f"\n✗ {e}. Stopping.")
-            failed.append({"name": key["name"], "error": str(e)})
-            break
 
-        except requests.exceptions.RequestException as e:
-            error_msg = str(e)
-            if hasattr(e, 'response') and e.response is not None:
-                try:
-                    error_msg = e.response.json()
-                except:
-                    error_msg = e.response.text
-            failed.append({"name": key["name"], "error": error_msg})
-            print(f"✗ Failed to delete {i}/{len(keys_to_delete)}: {key['name']} - {error_msg}")
-    
     print(f"\n✓ Deleted {len(deleted)} keys")
     if failed:
         print(f"✗ {len(failed)} keys failed to delete")
@@ -315,7 +518,12 @@ def delete_keys(
 
 if __name__ == "__main__":
     import argparse
-    
+
+    # Line-buffer progress output so each ✓/✗ line lands immediately even
+    # when stdout is redirected to a file (block-buffered by default)
+    sys.stdout.reconfigure(line_buffering=True)
+
+
     parser = argparse.ArgumentParser(
         description="Manage OpenRouter API keys for students",
         epilog='Environment: Set "OPENROUTER_PROVISIONING_KEY" to your provisioning API key.'
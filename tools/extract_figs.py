@@ -1,13 +1,33 @@
+import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from zipfile import ZipFile
 from pathlib import Path
 
 pptx = Path("talk.pptx")
 out = Path("images_out")
-out.mkdir(exist_ok=True)
+(out / "ppt" / "media").mkdir(parents=True, exist_ok=True)
+
+# ZipFile handles aren't thread-safe for open(), so each worker uses its own
+_local = threading.local()
+
+
+def _extract_one(info):
+    z = getattr(_local, "zip", None)
+    if z is None:
+        z = _local.zip = ZipFile(pptx)
+    # Stream straight into the target with a 1 MiB buffer instead of
+    # ZipFile.extract's per-entry temp file and directory rebuild
+    with z.open(info) as src, open(out / info.filename, "wb") as dst:
+        shutil.copyfileobj(src, dst, length=1 << 20)
+
 
 with ZipFile(pptx) as z:
-    for name in z.namelist():
-        if name.startswith("ppt/media/"):
-            z.extract(name, out)
+    media = [i for i in z.infolist() if i.filename.startswith("ppt/media/")]
+
+# Decompress + write entries concurrently; each entry is independent
+with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+    list(ex.map(_extract_one, media))
 
-print("Done. See images in images_out/ppt/media/")
\ No newline at end of file
+print("Done. See images in images_out/ppt/media/")
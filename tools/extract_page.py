@@ -1,22 +1,41 @@
 #!/usr/bin/env python3
-"""Extract a single page from a PDF as an image for quick preview."""
+"""Extract one or more pages from a PDF as images for quick preview."""
 
-import argparse
-import subprocess
 import sys
 from pathlib import Path
 
 
-def extract_page(pdf_path: Path, page_num: int, output_path: Path | None = None) -> Path:
-    """Extract a page from PDF using pdftoppm (comes with poppler)."""
-    if not pdf_path.exists():
-        print(f"Error: {pdf_path} does not exist", file=sys.stderr)
-        sys.exit(1)
+def _render_with_pdfium(pdf_path: Path, pages: list[int], out_for) -> bool:
+    """Render pages in-process with pypdfium2, opening the PDF once.
+
+    Avoids the fork+exec cost of a subprocess per page. Returns False when
+    pypdfium2 (or PIL, which it renders through) isn't installed so the
+    caller can fall back to external tools.
+    """
+    try:
+        import pypdfium2 as pdfium
+    except ImportError:
+        return False
+
+    pdf = pdfium.PdfDocument(str(pdf_path))
+    try:
+        for page_num in pages:
+            output_path = out_for(page_num)
+            bitmap = pdf[page_num - 1].render(scale=2)
+            try:
+                bitmap.to_pil().save(output_path, "PNG")
+            except ImportError:
+                return False
+            print(f"Extracted page {page_num} to {output_path}")
+    finally:
+        pdf.close()
+    return True
 
-    if output_path is None:
-        output_path = pdf_path.with_suffix(f".page{page_num}.png")
 
-    # Use sips (macOS built-in) via PDF rendering, or pdftoppm if available
+def _extract_page_subprocess(pdf_path: Path, page_num: int, output_path: Path) -> Path:
+    """Extract a page using external tools (pdftoppm, sips, convert)."""
+    import subprocess  # deferred: only needed when pypdfium2 is unavailable
+
     try:
         # Try pdftoppm first (better quality)
         result = subprocess.run(
@@ -59,18 +78,51 @@ def extract_page(pdf_path: Path, page_num: int, output_path: Path | None = None)
     except FileNotFoundError:
         pass
 
-    print("Error: No PDF extraction tool found (tried pdftoppm, sips, convert)", file=sys.stderr)
+    print("Error: No PDF extraction tool found (tried pypdfium2, pdftoppm, sips, convert)", file=sys.stderr)
     sys.exit(1)
 
 
+def extract_pages(pdf_path: Path, pages: list[int], output_path: Path | None = None) -> list[Path]:
+    """Extract the given pages, preferring in-process rendering via pypdfium2.
+
+    output_path only applies when a single page is requested; multi-page
+    extraction names each file <pdf>.pageN.png.
+    """
+    if not pdf_path.exists():
+        print(f"Error: {pdf_path} does not exist", file=sys.stderr)
+        sys.exit(1)
+
+    def out_for(page_num: int) -> Path:
+        if output_path is not None and len(pages) == 1:
+            return output_path
+        return pdf_path.with_suffix(f".page{page_num}.png")
+
+    if _render_with_pdfium(pdf_path, pages, out_for):
+        return [out_for(p) for p in pages]
+
+    # pypdfium2 unavailable: one subprocess per page
+    return [_extract_page_subprocess(pdf_path, p, out_for(p)) for p in pages]
+
+
+def extract_page(pdf_path: Path, page_num: int, output_path: Path | None = None) -> Path:
+    """Extract a single page from a PDF."""
+    return extract_pages(pdf_path, [page_num], output_path)[0]
+
+
 def main():
-    parser = argparse.ArgumentParser(description='Extract a page from PDF as PNG')
+    import argparse  # deferred: only the CLI needs it
+
+    parser = argparse.ArgumentParser(description='Extract page(s) from PDF as PNG')
     parser.add_argument('pdf', type=Path, help='Input PDF file')
-    parser.add_argument('page', type=int, help='Page number (1-indexed)')
-    parser.add_argument('-o', '--output', type=Path, help='Output PNG path')
+    parser.add_argument('pages', type=int, nargs='+', metavar='page',
+                        help='Page number(s) (1-indexed)')
+    parser.add_argument('-o', '--output', type=Path,
+                        help='Output PNG path (single page only)')
 
     args = parser.parse_args()
-    extract_page(args.pdf, args.page, args.output)
+    if args.output and len(args.pages) > 1:
+        parser.error("-o/--output only applies when extracting a single page")
+    extract_pages(args.pdf, args.pages, args.output)
 
 
 if __name__ == '__main__':
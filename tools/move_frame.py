@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 """Move or copy beamer frames between positions within a file or across files."""
 
-import argparse
+import mmap
+import os
 import re
 import sys
+import tempfile
 from pathlib import Path
 
 
@@ -21,94 +23,162 @@ def parse_range(range_str: str) -> list[int]:
         return [int(range_str)]
 
 
-def parse_frames(content: str) -> list[tuple[int, int, str]]:
-    r"""Parse content and return list of (start_idx, end_idx, frame_text) tuples.
+# Frame constructs at the start of a line, together with any run of comment
+# lines immediately above them, so each frame (and its leading comments) is
+# captured in one forward match
+_RE_FRAME_START = re.compile(r'(?m)^(?:[ \t]*%[^\n]*\n)*[ \t]*\\(begin\{frame\}|frame\{|againframe)')
+_RE_BEGIN_END = re.compile(r'(?m)^[ \t]*\\(begin|end)\{frame\}')
+# Title forms: \begin{frame}{Title}, \begin{frame}[options]{Title}, \frame{\titlepage}
+_RE_TITLE = re.compile(r'\\begin\{frame\}(?:<[^>]*>)?(?:\[[^\]]*\])?\{([^}]*)\}')
+_RE_FRAME_CMD = re.compile(r'\\frame\{\\(\w+)\}')
 
+# Byte-pattern twins of the above so read-only paths can scan a memory-mapped
+# file without decoding it (the patterns themselves are pure ASCII)
+_RE_FRAME_START_B = re.compile(_RE_FRAME_START.pattern.encode('ascii'))
+_RE_BEGIN_END_B = re.compile(_RE_BEGIN_END.pattern.encode('ascii'))
+_RE_TITLE_B = re.compile(_RE_TITLE.pattern.encode('ascii'))
+_RE_FRAME_CMD_B = re.compile(_RE_FRAME_CMD.pattern.encode('ascii'))
+
+
+def _line_end(content, newline, pos: int) -> int:
+    """Return the offset just past the newline ending the line containing pos."""
+    nl = content.find(newline, pos)
+    return len(content) if nl == -1 else nl + 1
+
+
+def _atomic_write(path: Path, content: str) -> None:
+    """Replace path's contents atomically.
+
+    Writes to a sibling temp file (large buffer, same directory so the rename
+    stays on one filesystem) and os.replace()s it over the original, so a
+    crash mid-write never leaves a truncated .tex file behind.
+    """
+    tmp = tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=path.parent,
+                                      prefix=f'.{path.name}.', suffix='.tmp',
+                                      delete=False, buffering=1 << 20)
+    try:
+        with tmp:
+            tmp.write(content)
+        os.replace(tmp.name, path)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
+
+
+def _remove_spans(content: str, spans: list[tuple[int, int]]) -> str:
+    """Drop the given (start, end) spans, joining the kept pieces in one pass."""
+    pieces = []
+    prev = 0
+    for start, end in sorted(spans):
+        pieces.append(content[prev:start])
+        prev = end
+    pieces.append(content[prev:])
+    return ''.join(pieces)
+
+
+def parse_frames(content: str | bytes) -> list[tuple[int, int, str | bytes]]:
+    r"""Parse content and return list of (start, end, frame_text) tuples.
+
+    start/end are character offsets into content; each span covers whole
+    lines (end points just past the newline closing the frame), so callers
+    can splice frames with content[:start] + ... + content[end:].
     Includes preceding comment lines as part of each frame.
     Handles both \begin{frame}...\end{frame} and \frame{...} syntax.
     Skips \againframe references.
+
+    One compiled-regex sweep locates all frame starts in a single pass
+    instead of running several re.match calls per line.
+
+    content may also be bytes (or a read-only mmap), in which case the
+    byte-pattern twins are used and frame_text is returned as bytes.
     """
+    if isinstance(content, str):
+        frame_start_re, begin_end_re = _RE_FRAME_START, _RE_BEGIN_END
+        newline, kind_begin, kind_again, word_begin = '\n', 'begin{frame}', 'againframe', 'begin'
+    else:
+        frame_start_re, begin_end_re = _RE_FRAME_START_B, _RE_BEGIN_END_B
+        newline, kind_begin, kind_again, word_begin = b'\n', b'begin{frame}', b'againframe', b'begin'
+
     frames = []
-    lines = content.split('\n')
-    i = 0
+    scan_from = 0
+
+    for m in frame_start_re.finditer(content):
+        # Skip matches inside the frame we just consumed
+        if m.start() < scan_from:
+            continue
 
-    while i < len(lines):
-        line = lines[i]
+        kind = m.group(1)
 
         # Skip \againframe (it's a reference, not a frame definition)
-        if re.match(r'\s*\\againframe', line):
-            i += 1
+        if kind == kind_again:
             continue
 
-        # Look for \begin{frame}
-        if re.match(r'\s*\\begin\{frame\}', line):
-            # Collect preceding comment lines
-            start_idx = i
-            while start_idx > 0 and re.match(r'\s*%', lines[start_idx - 1]):
-                start_idx -= 1
+        # Match already starts at the first preceding comment line, if any
+        start = m.start()
 
+        if kind == kind_begin:
             # Find matching \end{frame}
             depth = 1
-            end_idx = i + 1
-            while end_idx < len(lines) and depth > 0:
-                if re.match(r'\s*\\begin\{frame\}', lines[end_idx]):
-                    depth += 1
-                elif re.match(r'\s*\\end\{frame\}', lines[end_idx]):
-                    depth -= 1
-                end_idx += 1
-
-            frame_text = '\n'.join(lines[start_idx:end_idx])
-            frames.append((start_idx, end_idx, frame_text))
-            i = end_idx
-
-        # Look for \frame{...} shorthand (single line, e.g., \frame{\titlepage})
-        elif re.match(r'\s*\\frame\{', line):
-            # Collect preceding comment lines
-            start_idx = i
-            while start_idx > 0 and re.match(r'\s*%', lines[start_idx - 1]):
-                start_idx -= 1
-
-            # For single-line \frame{...}, just include that line
-            frame_text = '\n'.join(lines[start_idx:i + 1])
-            frames.append((start_idx, i + 1, frame_text))
-            i += 1
+            end = len(content)
+            for bm in begin_end_re.finditer(content, m.end()):
+                depth += 1 if bm.group(1) == word_begin else -1
+                if depth == 0:
+                    end = _line_end(content, newline, bm.end())
+                    break
         else:
-            i += 1
+            # \frame{...} shorthand (single line, e.g., \frame{\titlepage})
+            end = _line_end(content, newline, m.end())
+
+        frames.append((start, end, content[start:end]))
+        scan_from = end
 
     return frames
 
 
-def get_frame_title(frame_text: str) -> str:
-    """Extract frame title from frame text."""
+def get_frame_title(frame_text: str | bytes) -> str:
+    """Extract frame title from frame text (str or bytes; title spans are decoded)."""
+    is_text = isinstance(frame_text, str)
     # Match \begin{frame}{Title} or \begin{frame}[options]{Title}
-    match = re.search(r'\\begin\{frame\}(?:<[^>]*>)?(?:\[[^\]]*\])?\{([^}]*)\}', frame_text)
+    match = (_RE_TITLE if is_text else _RE_TITLE_B).search(frame_text)
     if match:
-        return match.group(1)
+        title = match.group(1)
+        return title if is_text else title.decode('utf-8')
     # Match \frame{\titlepage} or similar
-    match = re.search(r'\\frame\{\\(\w+)\}', frame_text)
+    match = (_RE_FRAME_CMD if is_text else _RE_FRAME_CMD_B).search(frame_text)
     if match:
-        return f"\\{match.group(1)}"
+        cmd = match.group(1)
+        return f"\\{cmd if is_text else cmd.decode('utf-8')}"
     return "(no title)"
 
 
 def list_frames(input_file: Path) -> None:
     """List all frames with their numbers."""
-    content = input_file.read_text()
-    frames = parse_frames(content)
+    # Read-only path: scan the memory-mapped bytes directly and decode only
+    # the title spans, skipping the full-file UTF-8 decode
+    with open(input_file, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files can't be mapped
+            print(f"No frames found in {input_file}")
+            return
 
-    if not frames:
-        print(f"No frames found in {input_file}")
-        return
+        with mm:
+            frames = parse_frames(mm)
+
+            if not frames:
+                print(f"No frames found in {input_file}")
+                return
 
-    print(f"Frames in {input_file.name}:")
-    for i, (_, _, frame_text) in enumerate(frames, 1):
-        title = get_frame_title(frame_text)
-        print(f"  {i}: {title}")
+            print(f"Frames in {input_file.name}:")
+            for i, (_, _, frame_text) in enumerate(frames, 1):
+                title = get_frame_title(frame_text)
+                print(f"  {i}: {title}")
 
 
 def delete_frames(input_file: Path, from_positions: list[int]) -> None:
     """Delete frame(s) from the file."""
-    content = input_file.read_text()
+    content = input_file.read_text(encoding='utf-8')
     frames = parse_frames(content)
 
     if not frames:
@@ -121,14 +191,7 @@ def delete_frames(input_file: Path, from_positions: list[int]) -> None:
             print(f"Error: --from {pos} is out of range (1-{len(frames)})", file=sys.stderr)
             sys.exit(1)
 
-    lines = content.split('\n')
-
-    # Remove frames in reverse order to preserve indices
-    for pos in reversed(from_positions):
-        start_idx, end_idx, _ = frames[pos - 1]
-        lines = lines[:start_idx] + lines[end_idx:]
-
-    input_file.write_text('\n'.join(lines))
+    _atomic_write(input_file, _remove_spans(content, [frames[pos - 1][:2] for pos in from_positions]))
     from_range_str = f"{from_positions[0]}-{from_positions[-1]}" if len(from_positions) > 1 else str(from_positions[0])
     print(f"Deleted frame(s) {from_range_str} from {input_file.name}")
 
@@ -136,7 +199,7 @@ def delete_frames(input_file: Path, from_positions: list[int]) -> None:
 def move_frames(input_file: Path, from_positions: list[int], to_pos: int,
                 output_file: Path | None, copy_mode: bool) -> None:
     """Move or copy frame(s) from one position to another."""
-    content = input_file.read_text()
+    content = input_file.read_text(encoding='utf-8')
     frames = parse_frames(content)
 
     if not frames:
@@ -149,9 +212,10 @@ def move_frames(input_file: Path, from_positions: list[int], to_pos: int,
             print(f"Error: --from {pos} is out of range (1-{len(frames)})", file=sys.stderr)
             sys.exit(1)
 
-    # Get the frames to move (combined text)
+    # Get the frames to move (combined text; each span already ends with a
+    # newline except possibly the last line of the file)
     frame_texts = [frames[pos - 1][2] for pos in from_positions]
-    combined_frame_text = '\n'.join(frame_texts)
+    combined_frame_text = ''.join(t if t.endswith('\n') else t + '\n' for t in frame_texts)
     from_range_str = f"{from_positions[0]}-{from_positions[-1]}" if len(from_positions) > 1 else str(from_positions[0])
 
     # Determine destination
@@ -161,7 +225,7 @@ def move_frames(input_file: Path, from_positions: list[int], to_pos: int,
             print(f"Error: Output file {output_file} does not exist", file=sys.stderr)
             sys.exit(1)
 
-        dest_content = output_file.read_text()
+        dest_content = output_file.read_text(encoding='utf-8')
         dest_frames = parse_frames(dest_content)
 
         if to_pos < 1 or to_pos > len(dest_frames) + 1:
@@ -169,24 +233,17 @@ def move_frames(input_file: Path, from_positions: list[int], to_pos: int,
             sys.exit(1)
 
         # Insert into destination
-        dest_lines = dest_content.split('\n')
         if to_pos <= len(dest_frames):
             insert_at = dest_frames[to_pos - 1][0]
         else:
-            insert_at = dest_frames[-1][1] if dest_frames else len(dest_lines)
+            insert_at = dest_frames[-1][1] if dest_frames else len(dest_content)
 
-        new_dest_lines = dest_lines[:insert_at] + combined_frame_text.split('\n') + dest_lines[insert_at:]
-        output_file.write_text('\n'.join(new_dest_lines))
+        _atomic_write(output_file, dest_content[:insert_at] + combined_frame_text + dest_content[insert_at:])
         print(f"Inserted frame(s) {from_range_str} at position {to_pos} in {output_file.name}")
 
         # Remove from source if move mode
         if not copy_mode:
-            lines = content.split('\n')
-            # Remove frames in reverse order to preserve indices
-            for pos in reversed(from_positions):
-                start_idx, end_idx, _ = frames[pos - 1]
-                lines = lines[:start_idx] + lines[end_idx:]
-            input_file.write_text('\n'.join(lines))
+            _atomic_write(input_file, _remove_spans(content, [frames[pos - 1][:2] for pos in from_positions]))
             print(f"Removed frame(s) {from_range_str} from {input_file.name}")
     else:
         # In-place operation
@@ -199,16 +256,14 @@ def move_frames(input_file: Path, from_positions: list[int], to_pos: int,
             print("Nothing to do: source and destination are the same")
             return
 
-        lines = content.split('\n')
-
         # For contiguous ranges, get the span from first to last frame
         first_frame_start = frames[from_positions[0] - 1][0]
         last_frame_end = frames[from_positions[-1] - 1][1]
 
         # Remove the entire range at once
-        lines_without_moved = lines[:first_frame_start] + lines[last_frame_end:]
+        remaining = content[:first_frame_start] + content[last_frame_end:]
 
-        # Calculate how many lines were removed
+        # Calculate how many characters were removed
         removed_count = last_frame_end - first_frame_start
 
         # Determine insert position based on remaining frames
@@ -235,17 +290,103 @@ def move_frames(input_file: Path, from_positions: list[int], to_pos: int,
                     if (i + 1) not in from_positions:
                         adj_e = e - removed_count if e > first_frame_start else e
                         last_remaining = adj_e
-                insert_at = last_remaining if last_remaining else len(lines_without_moved)
+                insert_at = last_remaining if last_remaining else len(remaining)
 
         # Insert the moved frames at the new position
-        final_lines = lines_without_moved[:insert_at] + combined_frame_text.split('\n') + lines_without_moved[insert_at:]
-
         dest = output_file if output_file else input_file
-        dest.write_text('\n'.join(final_lines))
+        _atomic_write(dest, remaining[:insert_at] + combined_frame_text + remaining[insert_at:])
         print(f"Moved frame(s) {from_range_str} to position {to_pos} in {dest.name}")
 
 
+def parse_script(script_file: Path) -> list[tuple[str, list[int], int | None]]:
+    """Parse a batch script into (op, from_positions, to_pos) tuples.
+
+    Each line is 'move N|N-M TO' or 'delete N|N-M'; blank lines and
+    #-comments are ignored. All frame numbers refer to the numbering of
+    the file before any edit in the script is applied.
+    """
+    ops = []
+    for lineno, raw in enumerate(script_file.read_text(encoding='utf-8').splitlines(), 1):
+        line = raw.split('#', 1)[0].strip()
+        if not line:
+            continue
+        parts = line.split()
+        try:
+            if parts[0] == 'move' and len(parts) == 3:
+                ops.append(('move', parse_range(parts[1]), int(parts[2])))
+            elif parts[0] == 'delete' and len(parts) == 2:
+                ops.append(('delete', parse_range(parts[1]), None))
+            else:
+                raise ValueError(f"unknown operation: {line!r}")
+        except ValueError as e:
+            print(f"Error: {script_file.name}:{lineno}: {e}", file=sys.stderr)
+            sys.exit(1)
+    return ops
+
+
+def apply_edits(input_file: Path, ops: list[tuple[str, list[int], int | None]]) -> None:
+    """Apply a batch of move/delete operations with one parse and one write.
+
+    Frame numbers in every operation refer to the original file: 'move 5 3'
+    inserts original frame 5 before original frame 3 (use one past the last
+    frame number to move to the end). A frame may be the source of at most
+    one operation, and a move target must not itself be moved or deleted.
+    """
+    content = input_file.read_text(encoding='utf-8')
+    frames = parse_frames(content)
+
+    if not frames:
+        print(f"Error: No frames found in {input_file}", file=sys.stderr)
+        sys.exit(1)
+
+    # First pass: collect source frames and validate ranges
+    sources = set()
+    for op, from_positions, to_pos in ops:
+        for pos in from_positions:
+            if pos < 1 or pos > len(frames):
+                print(f"Error: {op} {pos} is out of range (1-{len(frames)})", file=sys.stderr)
+                sys.exit(1)
+            if pos in sources:
+                print(f"Error: frame {pos} is the source of more than one operation", file=sys.stderr)
+                sys.exit(1)
+            sources.add(pos)
+
+    # Second pass: validate targets and build insertion events
+    events = [(frames[pos - 1][0], 'remove', frames[pos - 1][1]) for pos in sources]
+    for op, from_positions, to_pos in ops:
+        if op != 'move':
+            continue
+        if to_pos < 1 or to_pos > len(frames) + 1:
+            print(f"Error: move target {to_pos} is out of range (1-{len(frames) + 1})", file=sys.stderr)
+            sys.exit(1)
+        if to_pos in sources:
+            print(f"Error: move target {to_pos} is itself moved or deleted", file=sys.stderr)
+            sys.exit(1)
+        anchor = frames[to_pos - 1][0] if to_pos <= len(frames) else frames[-1][1]
+        text = ''.join(t if t.endswith('\n') else t + '\n'
+                       for t in (frames[pos - 1][2] for pos in from_positions))
+        events.append((anchor, 'insert', text))
+
+    # Single linear pass over the content: drop removed spans, splice
+    # insertions at their anchors, write once
+    pieces = []
+    prev = 0
+    for offset, kind, payload in sorted(events, key=lambda e: (e[0], e[1] == 'remove')):
+        pieces.append(content[prev:offset])
+        if kind == 'remove':
+            prev = payload
+        else:
+            pieces.append(payload)
+            prev = offset
+    pieces.append(content[prev:])
+
+    _atomic_write(input_file, ''.join(pieces))
+    print(f"Applied {len(ops)} edit(s) to {input_file.name}")
+
+
 def main():
+    import argparse  # deferred: only the CLI needs it
+
     parser = argparse.ArgumentParser(
         description='Move or copy beamer frames between positions.',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -256,6 +397,10 @@ Examples:
   %(prog)s lecture.tex --from 3-5 --to 1           # Move frames 3-5 to position 1
   %(prog)s lecture.tex --from 4-12 --delete        # Delete frames 4-12
   %(prog)s a.tex -o b.tex --from 2-4 --to 1 --copy # Copy frames to another file
+  %(prog)s lecture.tex --script edits.txt          # Batch edits: one parse, one write
+
+Script lines are "move N|N-M TO" or "delete N|N-M" (frame numbers refer
+to the file before any edit in the script is applied).
 ''')
 
     parser.add_argument('input_file', type=Path, help='Source .tex file')
@@ -273,6 +418,8 @@ Examples:
                         help='Delete the specified frame(s)')
     parser.add_argument('--list', action='store_true',
                         help='List all frames with numbers')
+    parser.add_argument('--script', type=Path, metavar='FILE',
+                        help='Apply a batch of move/delete edits from FILE')
 
     args = parser.parse_args()
 
@@ -284,6 +431,13 @@ Examples:
         list_frames(args.input_file)
         return
 
+    if args.script:
+        if not args.script.exists():
+            print(f"Error: Script file {args.script} does not exist", file=sys.stderr)
+            sys.exit(1)
+        apply_edits(args.input_file, parse_script(args.script))
+        return
+
     if args.from_pos is None:
         parser.error("--from is required when not using --list")
 